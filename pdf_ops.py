@@ -1,14 +1,285 @@
+import os
+import re
 import json
-from PIL import Image
+import time
+import shutil
+from io import BytesIO
+from itertools import islice
+from collections import deque
+from functools import partial, lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
-from PyPDF2 import PdfReader, PdfWriter, PdfMerger
-from typing import Tuple, Optional, Union, List, Dict
+from typing import TYPE_CHECKING, Tuple, Optional, Union, List, Dict, Iterator
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library json module is used instead
+    orjson = None
+
+# The PDF backend is imported by _load_backend() on first use rather than at
+# module import, so the GUI and CLI start without paying for it. Pillow and the
+# executors are likewise imported by the methods that use them.
+pymupdf = PdfReader = PdfWriter = PdfMerger = None
+PRODUCER = None
+# Name of the selected backend: "pymupdf", "pypdf" or "pypdf2".
+_BACKEND = None
+
+# PyMuPDF exposes metadata under its own keys; the rest of the toolkit uses the
+# PDF Info dictionary names (e.g. "/Title") that PyPDF2 returns.
+_PYMUPDF_METADATA_KEYS = {
+    "/Title": "title",
+    "/Author": "author",
+    "/Subject": "subject",
+    "/Keywords": "keywords",
+    "/Creator": "creator",
+    "/Producer": "producer",
+    "/CreationDate": "creationDate",
+    "/ModDate": "modDate",
+}
+
+_PDF_DATE_FORMAT = "D:%Y%m%d%H%M%S+00'00'"
+_timestamp_cache: Tuple[Optional[int], str] = (None, "")
+
+# Page sizes in points (1/72 inch), portrait orientation.
+_PAGE_SIZES = {
+    "A4": (595, 842), "A3": (842, 1191), "Letter": (612, 792),
+    "Legal": (612, 1008), "A5": (420, 595), "A6": (298, 420),
+    "B5": (498, 708), "B4": (708, 1000), "B3": (1000, 1414),
+    "Tabloid": (792, 1224), "Ledger": (1224, 792), "Executive": (522, 756),
+    "Foolscap": (648, 936), "Quarto": (610, 780), "10x14": (720, 1008),
+    "11x17": (792, 1224), "Statement": (396, 612), "Folio": (612, 936),
+}
+_MM_TO_PT = 2.83465
+_SCALING_INT_TO_STR = {1: "scale to fit", 2: "stretch to fit", 3: "actual size", 4: "stretch to fill"}
+
+# PdfWriter emits one small write per object; a large buffer batches them into few syscalls.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Bytes read from the end of a file when looking for its trailer. The spec puts
+# %%EOF within the last 1024 bytes; writers commonly leave a little slack.
+_TRAILER_PROBE_SIZE = 2048
+
+# Spawning worker processes only pays off once there are enough images (PyMuPDF)
+# or pages (PyPDF2) to decode per worker.
+_PARALLEL_MIN_IMAGES = 16
+_PARALLEL_MIN_PAGES = 16
+
+
+def _pdf_timestamp() -> str:
+    """Return the current UTC time as a PDF date string, reused within the same second."""
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.fromtimestamp(second, timezone.utc)
+                            .strftime(_PDF_DATE_FORMAT))
+    return _timestamp_cache[1]
+
+
+@lru_cache(maxsize=1024)
+def _has_pdf_header(path: str, mtime_ns: int, size: int) -> bool:
+    """Check a file's PDF header; mtime and size are part of the key so edits miss the cache."""
+    with open(path, "rb", buffering=0) as f:  # Only 5 bytes are read; skip the buffer
+        return f.read(5) == b"%PDF-"
+
+
+@lru_cache(maxsize=1024)
+def _has_pdf_trailer(path: str, mtime_ns: int, size: int) -> bool:
+    """Check that a file ends with a PDF trailer, i.e. was not truncated; keyed like _has_pdf_header."""
+    with open(path, "rb", buffering=0) as f:
+        f.seek(max(0, size - _TRAILER_PROBE_SIZE))
+        return _is_pdf_tail(f.read(_TRAILER_PROBE_SIZE))
+
+
+def _is_pdf_tail(tail: bytes) -> bool:
+    """Return True if the last bytes of a file hold the startxref offset and %%EOF marker."""
+    return b"startxref" in tail and b"%%EOF" in tail
+
+
+def _load_backend() -> None:
+    """Import the PDF backend once; PyMuPDF is preferred, pypdf (or PyPDF2) is the fallback."""
+    global pymupdf, PdfReader, PdfWriter, PdfMerger, PRODUCER, _BACKEND
+    if PRODUCER:
+        return
+    try:
+        import pymupdf
+        PRODUCER = "PDF Toolkit with PyMuPDF"
+        _BACKEND = "pymupdf"
+    except ImportError:  # pypdf (or the older PyPDF2) is a pure-Python fallback
+        try:
+            from pypdf import PdfReader, PdfWriter
+            PRODUCER = "PDF Toolkit with pypdf"
+            _BACKEND = "pypdf"
+        except ImportError:
+            from PyPDF2 import PdfReader, PdfWriter, PdfMerger
+            PRODUCER = "PDF Toolkit with PyPDF2"
+            _BACKEND = "pypdf2"
+
+
+def _extract_image_batch(file_path: str, xrefs: List[int]) -> List[Tuple[Optional[bytes], str]]:
+    """Decode the given image xrefs of a PDF; runs inside a worker process."""
+    _load_backend()
+    results = []
+    with pymupdf.open(file_path) as doc:
+        for xref in xrefs:
+            image = doc.extract_image(xref)
+            results.append((image["image"], image["ext"]) if image else (None, ""))
+    return results
+
+
+def _iter_page_images(page) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (suffix, data) for each image on a page, decoded by the PDF library.
+
+    pypdf's page.images includes images drawn inside Form XObjects; PyPDF2's
+    only looks at the page's own XObjects, so there the forms are walked here
+    (with an explicit stack) and their resources passed back to the library.
+    """
+    if '/Resources' not in page:
+        return  # PyPDF2's page.images raises KeyError here; the page draws nothing
+    for image in page.images:
+        yield Path(image.name).suffix, image.data
+    if _BACKEND != "pypdf2":
+        return
+    from PyPDF2 import PageObject
+    from PyPDF2.generic import NameObject
+
+    seen_idnums = set()
+    stack = [page]
+    while stack:
+        resources = stack.pop().get('/Resources')
+        x_objects = resources.get_object().get('/XObject') if resources else None
+        if not x_objects:
+            continue
+        x_objects = x_objects.get_object()
+        for object_key in x_objects:
+            idnum = getattr(x_objects.raw_get(object_key), "idnum", None)
+            if idnum is not None:
+                if idnum in seen_idnums:  # Also stops self-referencing forms
+                    continue
+                seen_idnums.add(idnum)
+            form = x_objects[object_key]
+            if form.get('/Subtype') != '/Form' or '/Resources' not in form:
+                continue
+            stack.append(form)
+            holder = PageObject()
+            holder[NameObject('/Resources')] = form.raw_get('/Resources')
+            for image in holder.images:
+                yield Path(image.name).suffix, image.data
+
+
+def _extract_page_images(file_path: str, page_numbers: range) -> List[List[Tuple[str, bytes]]]:
+    """Decode the images on the given pages with PyPDF2; runs inside a worker process."""
+    _load_backend()
+    reader = PdfReader(file_path)
+    return [list(_iter_page_images(reader.pages[page_num])) for page_num in page_numbers]
 
 
 class PdfTools:
     """A utility class for handling PDF files with various operations."""
 
+    # Image file extension per stream filter, checked in _FILTER_PRIORITY order.
+    _FILTER_EXT = {
+        "/DCTDecode": ".jpg",
+        "/JPXDecode": ".jp2",
+        "/FlateDecode": ".png",
+        "/LZWDecode": ".png",
+        "/CCITTFaxDecode": ".tiff",
+    }
+    _FILTER_PRIORITY = ("/DCTDecode", "/JPXDecode", "/FlateDecode", "/LZWDecode", "/CCITTFaxDecode")
+    # PyMuPDF names some formats differently; map them onto the _FILTER_EXT spelling.
+    _PYMUPDF_EXT = {"jpeg": "jpg"}
+
+    # One comma-separated page range token ("5" or "1-3"); empty tokens are allowed.
+    _RANGE_RE = re.compile(r"\s*(?:(\d+)(?:\s*-\s*(\d+))?)?\s*(?:,|$)")
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Most worker threads or processes a single operation may
+                use. Defaults to the number of CPUs.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        # File contents and parsed documents keyed by path, tagged with the
+        # (mtime, size) they were read at.
+        self._document_cache: Dict[str, Tuple[Tuple[int, int], bytes, object]] = {}
+
+    @staticmethod
+    def _file_stamp(file_path: Path) -> Tuple[int, int]:
+        """Return the (mtime, size) pair used to detect changes to a file."""
+        stat = file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_cached(self, file_path: Path) -> Tuple[bytes, object]:
+        """
+        Return the contents and parsed document of a PDF, reusing them while the file is unchanged.
+
+        The file is read with a single call and parsed from memory, which avoids
+        the many small reads the parsers would otherwise issue against the file.
+
+        Args:
+            file_path: Path to the PDF file.
+
+        Returns:
+            Tuple of the raw file bytes and a PyMuPDF document, or a PdfReader
+            when PyMuPDF is unavailable.
+        """
+        _load_backend()
+        file_path = Path(file_path)
+        stamp = self._file_stamp(file_path)
+        cached = self._document_cache.get(str(file_path))
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2]
+        data = file_path.read_bytes()
+        document = (pymupdf.open(stream=data, filetype="pdf") if pymupdf
+                    else PdfReader(BytesIO(data)))
+        self._document_cache[str(file_path)] = (stamp, data, document)
+        return data, document
+
+    def _get_document(self, file_path: Path):
+        """Return the cached parsed document for a PDF; see _get_cached."""
+        return self._get_cached(file_path)[1]
+
+    def clear_cache(self) -> None:
+        """Release all cached documents."""
+        if pymupdf:
+            for _, _, document in self._document_cache.values():
+                document.close()
+        self._document_cache.clear()
+
+    @staticmethod
+    def _from_pymupdf_metadata(metadata: Dict) -> Dict:
+        """Convert PyMuPDF metadata into an Info-dictionary style mapping."""
+        return {key: metadata[name] for key, name in _PYMUPDF_METADATA_KEYS.items()
+                if metadata.get(name)}
+
+    @classmethod
+    def _pymupdf_info(cls, doc) -> Dict:
+        """
+        Read a PyMuPDF document's Info dictionary, custom entries included.
+
+        doc.metadata only carries the standard keys, so the trailer's Info
+        object is read key by key instead; strings come back decoded.
+        """
+        kind, ref = doc.xref_get_key(-1, "Info")
+        if kind != "xref":  # No Info dictionary, or a direct one in the trailer
+            return cls._from_pymupdf_metadata(doc.metadata)
+        xref = int(ref.split()[0])
+        info = {}
+        for name in doc.xref_get_keys(xref):
+            kind, value = doc.xref_get_key(xref, name)
+            if kind != "null" and value:
+                info[f"/{name}"] = value
+        return info
+
+    @staticmethod
+    def _to_pymupdf_metadata(metadata: Dict) -> Dict:
+        """Convert an Info-dictionary style mapping into PyMuPDF metadata."""
+        return {name: str(metadata[key]) for key, name in _PYMUPDF_METADATA_KEYS.items()
+                if key in metadata}
+
     def read_pdf(self, file_path: Path) -> Tuple[str, Dict]:
         """
         Read the PDF file and return its name and metadata.
@@ -23,30 +294,48 @@ class PdfTools:
             ValueError: If the PDF contains no pages.
             IOError: If the file cannot be read.
         """
+        _load_backend()
+        file_path = Path(file_path)
         try:
-            reader = PdfReader(file_path)
-            if not reader.pages:
-                raise ValueError(f"{file_path.name} contains no pages")
-            metadata = reader.metadata or {}
+            if pymupdf:
+                doc = self._get_document(file_path)
+                if not doc.is_pdf:
+                    raise ValueError(f"{file_path.name} is not a PDF file")
+                if not doc.page_count:
+                    raise ValueError(f"{file_path.name} contains no pages")
+                metadata = self._pymupdf_info(doc)
+            else:
+                reader = self._get_document(file_path)
+                if not reader.pages:
+                    raise ValueError(f"{file_path.name} contains no pages")
+                metadata = reader.metadata or {}
             return file_path.name, metadata
         except Exception as e:
             raise IOError(f"Error reading {file_path}: {e}")
 
-    def is_valid_pdf(self, file_path: Path) -> bool:
+    def is_valid_pdf(self, file_path: Path, check_trailer: bool = False) -> bool:
         """
         Check if the file is a valid PDF.
 
         Args:
             file_path: Path to the file.
+            check_trailer: Also require the startxref/%%EOF trailer at the end of
+                the file, which catches truncated files without parsing them.
 
         Returns:
             True if the file is a valid PDF, False otherwise.
         """
         try:
-            with file_path.open('rb') as f:
-                header = f.read(5)
-                return header.hex() == "255044462d"
-        except Exception as e:
+            file_path = Path(file_path)
+            stamp = self._file_stamp(file_path)
+            cached = self._document_cache.get(str(file_path))
+            if cached and cached[0] == stamp:
+                data = cached[1]
+                return data[:5] == b"%PDF-" and (
+                    not check_trailer or _is_pdf_tail(data[-_TRAILER_PROBE_SIZE:]))
+            return _has_pdf_header(str(file_path), *stamp) and (
+                not check_trailer or _has_pdf_trailer(str(file_path), *stamp))
+        except Exception:
             return False
 
     def save_metadata_to_json(self, metadata: Dict, output_path: Path) -> None:
@@ -61,8 +350,15 @@ class PdfTools:
                 IOError: If the file cannot be written.
             """
             try:
-                with output_path.open("w", encoding="utf-8") as f:
-                    json.dump(metadata, f, ensure_ascii=False, indent=4)
+                output_path = Path(output_path)
+                if orjson:
+                    output_path.write_bytes(orjson.dumps(
+                        metadata, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                    return
+                output_path.write_text(
+                    json.dumps(metadata, ensure_ascii=False, indent=4, default=str),
+                    encoding="utf-8")
             except Exception as e:
                 raise IOError(f"Error saving metadata to {output_path}: {e}")
 
@@ -77,8 +373,10 @@ class PdfTools:
                 Metadata dictionary, or empty dict if file cannot be read.
             """
             try:
-                with json_path.open("r", encoding="utf-8") as f:
-                    return json.load(f)
+                json_path = Path(json_path)
+                if orjson:
+                    return orjson.loads(json_path.read_bytes())
+                return json.loads(json_path.read_bytes())
             except Exception:
                 return {}
 
@@ -94,18 +392,44 @@ class PdfTools:
             Raises:
                 IOError: If the PDF cannot be read or written.
             """
+            _load_backend()
+            output_path = Path(output_path)
             try:
-                reader = PdfReader(file_path)
+                if self._metadata_unchanged(file_path, metadata):
+                    # Re-serializing would reproduce the input, so copy the bytes instead.
+                    if Path(file_path).resolve() != Path(output_path).resolve():
+                        shutil.copyfile(file_path, output_path)
+                    return
+                if pymupdf:
+                    # Open a separate document so the cached one keeps its metadata;
+                    # working from memory also lets output_path overwrite file_path.
+                    data, _ = self._get_cached(file_path)
+                    with pymupdf.open(stream=data, filetype="pdf") as doc:
+                        if metadata is not None:
+                            # set_metadata keeps keys it is not given, so blank every
+                            # key first; fields the caller left out are then removed.
+                            cleared = dict.fromkeys(_PYMUPDF_METADATA_KEYS.values(), "")
+                            doc.set_metadata({**cleared, **self._to_pymupdf_metadata(metadata)})
+                        doc.save(output_path, garbage=4, deflate=True)
+                    return
+                reader = self._get_document(file_path)
                 writer = PdfWriter()
-                for page in reader.pages:
-                    writer.add_page(page)
+                writer.append_pages_from_reader(reader)
                 if metadata:
                     writer.add_metadata(metadata)
-                with output_path.open("wb") as f:
+                with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
                     writer.write(f)
             except Exception as e:
                 raise IOError(f"Error saving PDF to {output_path}: {e}")
 
+    def _metadata_unchanged(self, file_path: Path, metadata: Optional[Dict]) -> bool:
+        """Return True if saving metadata would leave the PDF's Info dictionary as it is."""
+        if metadata is None:
+            return True
+        _, current = self.read_pdf(Path(file_path))
+        return ({key: str(value) for key, value in metadata.items() if value} ==
+                {key: str(value) for key, value in current.items() if value})
+
     def parse_page_range(self, page_range: str, total_pages: int) -> List[int]:
             """
             Parse a page range string into a list of page indices.
@@ -120,30 +444,33 @@ class PdfTools:
             Raises:
                 ValueError: If the page range is invalid.
             """
-            pages = set()
-            for part in page_range.split(","):
-                part = part.strip()
-                if not part:
+            mask = 0  # Bit i set means page i is selected
+            pos = 0
+            while pos < len(page_range):
+                match = self._RANGE_RE.match(page_range, pos)
+                if not match:
+                    part = page_range[pos:].split(",", 1)[0].strip()
+                    raise ValueError(f"Invalid page range: {part}")
+                pos = match.end()
+                first, last = match.groups()
+                if first is None:
                     continue
-                if "-" in part:
-                    try:
-                        start, end = map(int, part.split("-", 1))
-                        start -= 1
-                        end -= 1
-                        if not (0 <= start <= end < total_pages):
-                            raise ValueError(f"Range {part} out of bounds (1-{total_pages})")
-                        pages.update(range(start, end + 1))
-                    except ValueError as e:
-                        raise ValueError(f"Invalid range: {part}") from e
-                else:
-                    try:
-                        page = int(part) - 1
-                        if not 0 <= page < total_pages:
-                            raise ValueError(f"Page {part} out of bounds (1-{total_pages})")
-                        pages.add(page)
-                    except ValueError:
-                        raise ValueError(f"Invalid page: {part}")
-            return sorted(pages)
+                part = f"{first}-{last}" if last else first
+                start = int(first) - 1
+                end = int(last) - 1 if last else start
+                if start > end:
+                    raise ValueError(f"Invalid range: {part}")
+                if not 0 <= start <= end < total_pages:
+                    kind = "Range" if last else "Page"
+                    raise ValueError(f"{kind} {part} out of bounds (1-{total_pages})")
+                mask |= ((1 << (end - start + 1)) - 1) << start
+            bits = bin(mask)[:1:-1]  # Lowest bit first
+            pages = []
+            page = bits.find("1")
+            while page != -1:
+                pages.append(page)
+                page = bits.find("1", page + 1)
+            return pages
     
     def extract_pages(self, file_path: Path, page_range: str, output_path: Path) -> None:
             """
@@ -158,29 +485,66 @@ class PdfTools:
                 ValueError: If the page range is invalid or no pages to extract.
                 IOError: If the PDF cannot be read or written.
             """
+            _load_backend()
+            output_path = Path(output_path)
             try:
-                reader = PdfReader(file_path)
+                if pymupdf:
+                    self._extract_pages_pymupdf(file_path, page_range, output_path)
+                    return
+                reader = self._get_document(file_path)
                 total_pages = len(reader.pages)
                 if not total_pages:
-                    raise ValueError(f"No pages in {file_path.name}")
+                    raise ValueError(f"No pages in {Path(file_path).name}")
                 pages = self.parse_page_range(page_range, total_pages)
                 if not pages:
                     raise ValueError("No pages to extract")
                 writer = PdfWriter()
-                writer.add_metadata(
-                    {"/Creator":"Created by PDF Toolkit", 
-                    "/Producer":"PDF Toolkit with PyPDF2",
-                    "/CreationDate": datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%S+00'00'"),
-                    "/ModDate": datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%S+00'00'")
-                    }
-                )
+                writer.add_metadata(self._creation_metadata())
+                reader_pages = reader.pages  # Look the property up once, not per page
                 for page_idx in pages:
-                    writer.add_page(reader.pages[page_idx])
-                with output_path.open("wb") as f:
+                    writer.add_page(reader_pages[page_idx])
+                with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
                     writer.write(f)
             except Exception as e:
                 raise IOError(f"Error extracting pages to {output_path}: {e}")
 
+    def _extract_pages_pymupdf(self, file_path: Path, page_range: str, output_path: Path) -> None:
+        """Extract pages with PyMuPDF; see extract_pages."""
+        doc = self._get_document(file_path)
+        if not doc.page_count:
+            raise ValueError(f"No pages in {Path(file_path).name}")
+        pages = self.parse_page_range(page_range, doc.page_count)
+        if not pages:
+            raise ValueError("No pages to extract")
+        with pymupdf.open() as new_doc:
+            for first, last in self._page_runs(pages):
+                new_doc.insert_pdf(doc, from_page=first, to_page=last)
+            new_doc.set_metadata(self._to_pymupdf_metadata(self._creation_metadata()))
+            new_doc.save(output_path, garbage=4, deflate=True)
+
+    @staticmethod
+    def _page_runs(pages: List[int]) -> List[Tuple[int, int]]:
+        """Group sorted page indices into inclusive (first, last) runs of consecutive pages."""
+        runs = []
+        for page in pages:
+            if runs and runs[-1][1] == page - 1:
+                runs[-1] = (runs[-1][0], page)
+            else:
+                runs.append((page, page))
+        return runs
+
+    @staticmethod
+    def _creation_metadata() -> Dict:
+        """Return the metadata stamped on every PDF created by the toolkit."""
+        _load_backend()
+        now = _pdf_timestamp()
+        return {
+            "/Creator": "Created by PDF Toolkit",
+            "/Producer": PRODUCER,
+            "/CreationDate": now,
+            "/ModDate": now,
+        }
+
     def get_image_extension(self, filters):
         """
         Determine the file extension based on the image filters.
@@ -191,16 +555,8 @@ class PdfTools:
         Returns:
         str: File extension.
         """
-        if "/DCTDecode" in filters:
-            return ".jpg"
-        elif "/JPXDecode" in filters:
-            return ".jp2"
-        elif "/FlateDecode" in filters or "/LZWDecode" in filters:
-            return ".png"
-        elif "/CCITTFaxDecode" in filters:
-            return ".tiff"
-        else:
-            return ".bin"
+        filters = set(filters)
+        return next((self._FILTER_EXT[f] for f in self._FILTER_PRIORITY if f in filters), ".bin")
 
     def extract_images_from_pdf(self, file_path: Path, output_dir: Path) -> List[Path]:
         """
@@ -213,34 +569,124 @@ class PdfTools:
         Returns:
         List[Path]: List of paths to the extracted image files.
         """
+        _load_backend()
+        output_dir = Path(output_dir)
         if not output_dir.exists():
             output_dir.mkdir(parents=True, exist_ok=True)
         try:
+            if pymupdf:
+                return self._extract_images_pymupdf(file_path, output_dir)
             image_count = 0
-            reader = PdfReader(file_path)
+            reader = self._get_document(file_path)
             image_paths = []
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                # Get the XObject dictionary from the page's resources
-                x_objects = page.get('/Resources', {}).get('/XObject', {})
-                for object_key in x_objects:
-                    x_object = x_objects[object_key]
-                    if x_object.get('/Subtype') == '/Image':
+            page_count = len(reader.pages)
+            workers = min(self._max_workers, page_count // _PARALLEL_MIN_PAGES)
+            decoded_pages = None
+            seen_idnums = set()
+            if workers > 1 and hasattr(type(reader.pages[0]), "images"):
+                # Decoding is pure Python here, so spread contiguous page slices over processes.
+                size = -(-page_count // workers)
+                slices = [range(i, min(i + size, page_count)) for i in range(0, page_count, size)]
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    decoded_pages = [images for batch in executor.map(
+                        _extract_page_images, [str(file_path)] * len(slices), slices)
+                        for images in batch]
+            for page_num, page in enumerate(reader.pages):
+                # Look on the class: evaluating the property can raise KeyError
+                if hasattr(type(page), "images"):
+                    # PyPDF2 >= 3 resolves inherited resources and decodes the images itself
+                    images = decoded_pages[page_num] if decoded_pages else _iter_page_images(page)
+                    for suffix, data in images:
                         image_count += 1
-                        image_obj = x_object
-                        filters = image_obj.get('/Filter', [])
-                        if not isinstance(filters, list):
-                            filters = [filters]
-                        ext = self.get_image_extension(filters)
-                        file_name = f"page{page_num+1}_img{image_count}{ext}"
+                        file_name = f"page{page_num+1}_img{image_count}{suffix}"
                         image_file_path = output_dir / file_name
-                        with image_file_path.open("wb") as f:
-                            f.write(image_obj.get_data())
+                        image_file_path.write_bytes(data)
                         image_paths.append(image_file_path)
+                    continue
+                for image_obj in self._iter_image_xobjects(page, seen_idnums):
+                    image_count += 1
+                    filters = image_obj.get('/Filter', [])
+                    if not isinstance(filters, list):
+                        filters = [filters]
+                    ext = self.get_image_extension(filters)
+                    file_name = f"page{page_num+1}_img{image_count}{ext}"
+                    image_file_path = output_dir / file_name
+                    image_file_path.write_bytes(image_obj.get_data())
+                    image_paths.append(image_file_path)
             return image_paths
         except Exception as e:
             raise IOError(f"Error extracting images from {file_path}: {e}")
 
+    @staticmethod
+    def _iter_image_xobjects(page, seen_idnums: set):
+        """
+        Yield the image XObjects drawn by a page, including those nested in Form XObjects.
+
+        Resources are walked with an explicit stack. Each indirect object is
+        resolved at most once per document: object numbers already in
+        seen_idnums are skipped, which also stops self-referencing forms.
+        """
+        def resolve(obj):
+            get_object = getattr(obj, "get_object", None) or getattr(obj, "getObject", None)
+            return get_object() if get_object else obj
+
+        stack = [resolve(page.get('/Resources', {}))]
+        while stack:
+            x_objects = resolve(stack.pop().get('/XObject', {}))
+            for object_key in x_objects:
+                idnum = getattr(x_objects.raw_get(object_key), "idnum", None)
+                if idnum is not None:
+                    if idnum in seen_idnums:
+                        continue
+                    seen_idnums.add(idnum)
+                x_object = x_objects[object_key]
+                subtype = x_object.get('/Subtype')
+                if subtype == '/Image':
+                    yield x_object
+                elif subtype == '/Form':
+                    stack.append(resolve(x_object.get('/Resources', {})))
+
+    def _extract_images_pymupdf(self, file_path: Path, output_dir: Path) -> List[Path]:
+        """Extract images with PyMuPDF; see extract_images_from_pdf."""
+        doc = self._get_document(file_path)
+        # An image shared by several pages is one object; decode and write it once.
+        entries = []
+        seen_xrefs = set()
+        for page_num in range(doc.page_count):
+            for image_info in doc.get_page_images(page_num):
+                if image_info[0] not in seen_xrefs:
+                    seen_xrefs.add(image_info[0])
+                    entries.append((page_num, image_info[0]))
+        workers = min(self._max_workers, len(entries) // _PARALLEL_MIN_IMAGES)
+        if workers <= 1:
+            images = [doc.extract_image(xref) for _, xref in entries]
+            batches = [[(image["image"], image["ext"]) if image else (None, "")
+                        for image in images]]
+        else:
+            # Decoding is CPU bound, so spread contiguous slices over processes and
+            # write the results back here in page order.
+            size = -(-len(entries) // workers)
+            slices = [[xref for _, xref in entries[i:i + size]]
+                      for i in range(0, len(entries), size)]
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batches = list(executor.map(_extract_image_batch,
+                                            [str(file_path)] * len(slices), slices))
+
+        image_count = 0
+        image_paths = []
+        decoded = (image for batch in batches for image in batch)
+        for (page_num, _), (data, ext) in zip(entries, decoded):
+            if data is None:
+                continue
+            image_count += 1
+            ext = self._PYMUPDF_EXT.get(ext, ext)
+            image_file_path = output_dir / f"page{page_num+1}_img{image_count}.{ext}"
+            image_file_path.write_bytes(data)
+            image_paths.append(image_file_path)
+        return image_paths
+
     def concatenate_pdfs(self, pdf_files: List[Path], output_path: Path) -> None:
             """
             Merge multiple PDFs into a single PDF.
@@ -252,19 +698,42 @@ class PdfTools:
             Raises:
                 IOError: If the PDFs cannot be read or merged.
             """
+            _load_backend()
+            output_path = Path(output_path)
             try:
-                merger = PdfMerger()
-                merger.add_metadata(
-                    {
-                    "/Creator": "Created by PDF Toolkit",
-                    "/Producer": "PDF Toolkit with PyPDF2",
-                    "/CreationDate": datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%S+00'00'"),
-                    "/ModDate": datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%S+00'00'")
-                    }
-                )
+                if pymupdf:
+                    with pymupdf.open() as merged:
+                        if len(pdf_files) > 1:
+                            # Read the next few inputs concurrently while earlier ones are
+                            # merged. PyMuPDF itself is not thread-safe, so parsing stays
+                            # here; the window keeps only a few files in memory at once.
+                            workers = min(len(pdf_files), self._max_workers)
+                            paths = map(Path, pdf_files)
+                            from concurrent.futures import ThreadPoolExecutor
+                            with ThreadPoolExecutor(max_workers=workers) as executor:
+                                pending = deque(executor.submit(path.read_bytes)
+                                                for path in islice(paths, workers))
+                                while pending:
+                                    data = pending.popleft().result()
+                                    next_path = next(paths, None)
+                                    if next_path is not None:
+                                        pending.append(executor.submit(next_path.read_bytes))
+                                    with pymupdf.open(stream=data, filetype="pdf") as doc:
+                                        merged.insert_pdf(doc)
+                        else:
+                            for pdf_file in pdf_files:
+                                with pymupdf.open(pdf_file) as doc:
+                                    merged.insert_pdf(doc)
+                        merged.set_metadata(self._to_pymupdf_metadata(self._creation_metadata()))
+                        merged.save(output_path, garbage=4, deflate=True)
+                    return
+                # PdfWriter.append (pypdf, PyPDF2 >= 3) skips PdfMerger's bookkeeping. Outlines
+                # are not imported, matching the PyMuPDF path.
+                merger = PdfWriter() if hasattr(PdfWriter, "append") else PdfMerger()
+                merger.add_metadata(self._creation_metadata())
                 for pdf_file in pdf_files:
-                    merger.append(pdf_file)
-                with output_path.open("wb") as f:
+                    merger.append(pdf_file, import_outline=False)
+                with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
                     merger.write(f)
             except Exception as e:
                 raise IOError(f"Error merging PDFs to {output_path}: {e}")
@@ -299,58 +768,43 @@ class PdfTools:
             ValueError: If parameters are invalid.
             IOError: If images cannot be read or PDF cannot be written.
         """
-        page_sizes = {
-            "A4": (595, 842), "A3": (842, 1191), "Letter": (612, 792),
-            "Legal": (612, 1008), "A5": (420, 595), "A6": (298, 420),
-            "B5": (498, 708), "B4": (708, 1000), "B3": (1000, 1414),
-            "Tabloid": (792, 1224), "Ledger": (1224, 792), "Executive": (522, 756),
-            "Foolscap": (648, 936), "Quarto": (610, 780), "10x14": (720, 1008),
-            "11x17": (792, 1224), "Statement": (396, 612), "Folio": (612, 936),
-        }
-
-        if page_size not in page_sizes:
+        _load_backend()
+        output_path = Path(output_path)
+        if page_size not in _PAGE_SIZES:
             raise ValueError(f"Invalid page size: {page_size}")
 
-        page_width, page_height = page_sizes[page_size]
+        page_width, page_height = _PAGE_SIZES[page_size]
         if orientation.lower() == "landscape":
             page_width, page_height = page_height, page_width
 
-        MM_TO_PT = 2.83465
-        margins = [margin * MM_TO_PT for margin in (margin_left, margin_right,
+        margins = [margin * _MM_TO_PT for margin in (margin_left, margin_right,
                                                     margin_top, margin_bottom)]
         available_width = page_width - margins[0] - margins[1]
         available_height = page_height - margins[2] - margins[3]
 
         scaling = (scaling_option.lower() if isinstance(scaling_option, str)
-                else {1: "scale to fit", 2: "stretch to fit", 3: "actual size", 4: "stretch to fill"}
-                .get(scaling_option, "scale to fit"))
-
-        pdf_pages = []
-        for image_file in image_files:
-            try:
-                img = Image.open(image_file).convert("RGB")
-                img_width, img_height = img.size
-                if scaling == "stretch to fill":
-                    new_width, new_height = int(available_width), int(available_height)
-                elif scaling == "stretch to fit":
-                    ratio = max(available_width / img_width, available_height / img_height)
-                    new_width, new_height = int(img_width * ratio), int(img_height * ratio)
-                else:
-                    ratio = (1.0 if scaling == "actual size" else
-                            min(available_width / img_width, available_height / img_height)) # stretch to fill
-                    new_width, new_height = int(img_width * ratio), int(img_height * ratio)
-
-                resized_img = img.resize((new_width, new_height), Image.LANCZOS)
-                page = Image.new("RGB", (page_width, page_height), "white")
-                x = int(margins[0] + (available_width - new_width) / 2)
-                y = int(margins[2] + (available_height - new_height) / 2)
-                page.paste(resized_img, (x, y))
-                pdf_pages.append(page)
-            except Exception as e:
-                raise IOError(f"Error processing {image_file}: {e}")
+                else _SCALING_INT_TO_STR.get(scaling_option, "scale to fit"))
 
-        if not pdf_pages:
+        render_page = partial(self._render_image_page, page_width=page_width,
+                              page_height=page_height, margins=margins,
+                              available_width=available_width,
+                              available_height=available_height, scaling=scaling)
+        if not image_files:
             raise ValueError("No images to convert")
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Decoding and resampling run in Pillow's C code with the GIL released.
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            if pymupdf:
+                # Stream pages into the document as they are rendered, keeping only
+                # their JPEG data instead of every decoded page.
+                encoded_pages = executor.map(
+                    lambda image_file: self._encode_page(render_page(image_file)), image_files)
+                self._save_encoded_pages(encoded_pages, output_path)
+                return
+            pdf_pages = list(executor.map(render_page, image_files))
+
+        now = _pdf_timestamp()
         try:
             pdf_pages[0].save(
                 output_path, 
@@ -358,10 +812,94 @@ class PdfTools:
                 append_images=pdf_pages[1:],
                 title=str(output_path.name),
                 creator="Created by PDF Toolkit",
-                producer="PDF Toolkit with PyPDF2",
-                creationDate=datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%S+00'00'"),
-                modDate=datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%S+00'00'")
+                producer=PRODUCER,
+                creationDate=now,
+                modDate=now
             )
         except Exception as e:
             raise IOError(f"Error saving PDF to {output_path}: {e}")
+
+    @staticmethod
+    def _encode_page(page: "Image.Image") -> Tuple[int, int, bytes]:
+        """Compress a rendered page to JPEG, as Pillow's PDF writer would."""
+        buffer = BytesIO()
+        page.save(buffer, "JPEG")
+        return page.width, page.height, buffer.getvalue()
+
+    def _save_encoded_pages(self, encoded_pages, output_path: Path) -> None:
+        """
+        Write JPEG-encoded pages to a new PDF with PyMuPDF, one page per image.
+
+        Args:
+            encoded_pages: Iterable of (width, height, JPEG bytes) tuples.
+            output_path: Path to the output PDF file.
+
+        Raises:
+            IOError: If a page cannot be rendered or the PDF cannot be written.
+        """
+        with pymupdf.open() as doc:
+            for width, height, data in encoded_pages:
+                page = doc.new_page(width=width, height=height)
+                page.insert_image(page.rect, stream=data)
+            doc.set_metadata(self._to_pymupdf_metadata(
+                {"/Title": Path(output_path).name, **self._creation_metadata()}))
+            try:
+                doc.save(output_path, garbage=4, deflate=True)
+            except Exception as e:
+                raise IOError(f"Error saving PDF to {output_path}: {e}")
+
+    @staticmethod
+    def _render_image_page(
+        image_file: Path,
+        page_width: int,
+        page_height: int,
+        margins: List[float],
+        available_width: float,
+        available_height: float,
+        scaling: str
+    ) -> "Image.Image":
+        """
+        Scale an image and place it on a white page; see create_pdf_from_images.
+
+        Raises:
+            IOError: If the image cannot be read or processed.
+        """
+        from PIL import Image
+
+        try:
+            img = Image.open(image_file)
+            img_width, img_height = img.size
+            if scaling == "stretch to fill":
+                new_width, new_height = int(available_width), int(available_height)
+            elif scaling == "stretch to fit":
+                ratio = max(available_width / img_width, available_height / img_height)
+                new_width, new_height = int(img_width * ratio), int(img_height * ratio)
+            else:
+                ratio = (1.0 if scaling == "actual size" else
+                        min(available_width / img_width, available_height / img_height)) # stretch to fill
+                new_width, new_height = int(img_width * ratio), int(img_height * ratio)
+            if new_width < 1 or new_height < 1:
+                raise ValueError(f"scaled size {new_width}x{new_height} is empty; "
+                                 "height and width must be > 0")
+
+            if img.format == "JPEG":
+                # Let the decoder skip DCT detail that the resize would discard.
+                img.draft("RGB", (new_width * 2, new_height * 2))
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            # LANCZOS only pays off for modest downscales.
+            downscale = max(img.width / new_width, img.height / new_height)
+            resample = Image.BICUBIC if downscale >= 4 else Image.LANCZOS
+            resized_img = img.resize((new_width, new_height), resample)
+            if (new_width, new_height) == (page_width, page_height):
+                # No margins left to show, so the resized image already is the page.
+                return resized_img
+            # Grayscale images stay grayscale, which halves the bytes per page.
+            page = Image.new(img.mode, (page_width, page_height), "white")
+            x = int(margins[0] + (available_width - new_width) / 2)
+            y = int(margins[2] + (available_height - new_height) / 2)
+            page.paste(resized_img, (x, y))
+            return page
+        except Exception as e:
+            raise IOError(f"Error processing {image_file}: {e}")
  
\ No newline at end of file
@@ -1,9 +1,31 @@
+import os
+import queue
+import threading
 import tkinter as tk
 from pathlib import Path
+from functools import partial
 from pdf_ops import PdfTools
 from tkinterdnd2 import TkinterDnD, DND_FILES
 from tkinter import messagebox, filedialog, ttk
 
+WORKER_POLL_MS = 50  # How often the Tk loop checks for a finished background task
+DROP_DEBOUNCE_MS = 150  # Drops arriving closer together than this only load the last file
+# Accepted extensions per listbox, lower case and without the dot
+PDF_EXTENSIONS = frozenset({"pdf"})
+IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "bmp", "gif"})
+# Characters that make TkDND drop data a Tcl list rather than one plain path
+TCL_LIST_CHARS = frozenset(' \t\n{}"\\')
+
+METADATA_KEYS = (
+    "/Title", "/Subject", "/Keywords", "/Author",
+    "/Creator", "/Producer", "/CreationDate", "/ModDate",
+)
+PAGE_SIZES = (
+    "A4", "A3", "Letter", "Legal", "A5", "A6", "B5", "B4", "B3", "Tabloid", "Ledger",
+    "Executive", "Foolscap", "Quarto", "10x14", "11x17", "Statement", "Folio",
+)
+SCALINGS = ("Scale to Fit", "Stretch to Fit", "Actual Size", "Stretch to Fill")
+
 
 class PDFToolkitApp(TkinterDnD.Tk):
     """GUI application for PDF manipulation tools."""
@@ -13,14 +35,24 @@ class PDFToolkitApp(TkinterDnD.Tk):
         self.withdraw()  # Hide window until centered
         self.title("PDF Toolkit")
         self.geometry("620x680")
-        self.iconbitmap(default="assets/pdftoolkit.ico")
-        self.pdf_tools = PdfTools()
+        self.pdf_tools = PdfTools()  # Cheap: the PDF backend is imported on first use
+        self._worker = None
+        self._drop_after_id = None
+        self._last_dirs = {}  # Last directory used per kind of file dialog
+        self._pending_status = None
+        self._status_after_id = None
 
         self._setup_ui()
-        self.after(50, self.deiconify)  # Show window after setup
+        self.after(50, self._show_window)
+
+    def _show_window(self):
+        """Show the window after setup; the icon file is read once it has been drawn."""
+        self.deiconify()
+        self.after_idle(partial(self.iconbitmap, default="assets/pdftoolkit.ico"))
 
     def _setup_ui(self):
         """Initialize the UI components."""
+        ttk.Style(self).configure("Status.TLabel", relief="sunken", padding=5)
         self.create_menu()
         self.create_main_interface()
         self.setup_drag_and_drop()
@@ -66,54 +98,45 @@ class PDFToolkitApp(TkinterDnD.Tk):
         )
 
     def create_main_interface(self):
-        """Set up the scrollable main interface with notebook tabs."""
-        # Container for scrollable content
-        container = ttk.Frame(self)
-        container.pack(fill="both", expand=True)
-
-        # Scrollable canvas
-        self.canvas = tk.Canvas(container)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # Scrollable frame inside canvas
-        self.scrollable_frame = ttk.Frame(self.canvas)
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        self.scrollable_window = self.canvas.create_window(
-            (0, 0), window=self.scrollable_frame, anchor="nw"
-        )
-        self.canvas.bind(
-            "<Configure>",
-            lambda e: self.canvas.itemconfig(self.scrollable_window, width=e.width)
-        )
-
+        """Set up the main interface with notebook tabs and a status bar."""
         # Notebook for tabs
-        self.notebook = ttk.Notebook(self.scrollable_frame)
+        self.notebook = ttk.Notebook(self)
         self.notebook.pack(expand=True, fill="both")
 
-        # Add tabs
-        self.create_pdf_operations_tab()
-        self.create_pdf_merger_tab()
-        self.create_image_to_pdf_tab()
+        # Add tabs; each tab's widgets are only built the first time it is shown
+        self.merger_listbox = self.image_listbox = None
+        self._tab_builders = {}
+        for text, builder in [
+            ("PDF Operations", self.create_pdf_operations_tab),
+            ("PDF Merger", self.create_pdf_merger_tab),
+            ("Image to PDF", self.create_image_to_pdf_tab),
+        ]:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (builder, frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self._build_current_tab)
+        self._build_current_tab()
 
         # Status bar
-        status_frame = ttk.Frame(self.scrollable_frame)
-        status_frame.pack(fill="both", padx=20, pady=15)
-        ttk.Style().configure("Status.TLabel", relief="sunken", padding=5)
+        status_frame = ttk.Frame(self)
+        # Packed ahead of the notebook so a short window clips the tabs, not the status bar
+        status_frame.pack(side="bottom", fill="both", padx=20, pady=15, before=self.notebook)
         self.status_bar = ttk.Label(
             status_frame, text="Ready", style="Status.TLabel", anchor="w"
         )
         self.status_bar.pack(fill="x")
-
-    def create_pdf_operations_tab(self):
-        """Create the PDF Operations tab with file selection, metadata, and tools."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="PDF Operations")
+        # Shown below the status bar only while a background task runs
+        self.progress_bar = ttk.Progressbar(status_frame, mode="indeterminate")
+
+    def _build_current_tab(self, event=None):
+        """Build the selected tab's widgets if it has not been shown before."""
+        pending = self._tab_builders.pop(self.notebook.select(), None)
+        if pending:
+            builder, frame = pending
+            builder(frame)
+
+    def create_pdf_operations_tab(self, frame):
+        """Populate the PDF Operations tab with file selection, metadata, and tools."""
         main_frame = ttk.Frame(frame, padding=10)
         main_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
@@ -129,16 +152,7 @@ class PDFToolkitApp(TkinterDnD.Tk):
         # Metadata Editor
         metadata_frame = ttk.LabelFrame(main_frame, text="Metadata Editor", padding=10)
         metadata_frame.pack(fill="x", pady=10)
-        self.metadata_fields = {
-            "/Title": tk.StringVar(),
-            "/Subject": tk.StringVar(),
-            "/Keywords": tk.StringVar(),
-            "/Author": tk.StringVar(),
-            "/Creator": tk.StringVar(),
-            "/Producer": tk.StringVar(),
-            "/CreationDate": tk.StringVar(),
-            "/ModDate": tk.StringVar(),
-        }
+        self.metadata_fields = {key: tk.StringVar() for key in METADATA_KEYS}
         for i, (key, var) in enumerate(self.metadata_fields.items()):
             ttk.Label(metadata_frame, text=f"{key}:", width=13, anchor="e").grid(
                 row=i, column=0, padx=5, pady=2
@@ -189,10 +203,8 @@ class PDFToolkitApp(TkinterDnD.Tk):
             extractor_frame, text="Extract Images", width=16, command=self.extract_all_images
         ).grid(row=1, column=2, pady=2)
 
-    def create_pdf_merger_tab(self):
-        """Create the PDF Merger tab with listbox and controls."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="PDF Merger")
+    def create_pdf_merger_tab(self, frame):
+        """Populate the PDF Merger tab with listbox and controls."""
         main_frame = ttk.Frame(frame, padding=10)
         main_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
@@ -209,10 +221,8 @@ class PDFToolkitApp(TkinterDnD.Tk):
         # Merge Button
         ttk.Button(main_frame, text="Merge PDFs", command=self.merge_pdfs).pack(pady=10, side="top", fill="both")
 
-    def create_image_to_pdf_tab(self):
-        """Create the Image to PDF tab with listbox and conversion options."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Image to PDF")
+    def create_image_to_pdf_tab(self, frame):
+        """Populate the Image to PDF tab with listbox and conversion options."""
         main_frame = ttk.Frame(frame, padding=10)
         main_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
@@ -236,8 +246,7 @@ class PDFToolkitApp(TkinterDnD.Tk):
         ttk.Combobox(
             options_frame,
             textvariable=self.page_size_var,
-            values=["A4", "A3", "Letter", "Legal", "A5", "A6", "B5", "B4", "B3", "Tabloid", "Ledger", 
-                    "Executive", "Foolscap", "Quarto", "10x14", "11x17", "Statement", "Folio"],
+            values=PAGE_SIZES,
             state="readonly",
             width=10,
         ).grid(row=0, column=1, sticky="w")
@@ -258,7 +267,7 @@ class PDFToolkitApp(TkinterDnD.Tk):
         ttk.Combobox(
             options_frame,
             textvariable=self.scaling_var,
-            values=["Scale to Fit", "Stretch to Fit", "Actual Size", "Stretch to Fill"],
+            values=SCALINGS,
             state="readonly",
             width=12,
         ).grid(row=0, column=6, sticky="w")
@@ -268,21 +277,33 @@ class PDFToolkitApp(TkinterDnD.Tk):
         margins_frame.grid(row=1, column=0, columnspan=5, pady=5, sticky="w")
         ttk.Label(margins_frame, text="Margins (mm):").pack(side="left")
         self.margins = {}
+        validate_margin = (self.register(self._is_margin_text), "%P")
         for label, attr in [("L", "left"), ("R", "right"), ("T", "top"), ("B", "bottom")]:
-            entry = ttk.Entry(margins_frame, width=5)
-            entry.insert(0, "10")
-            entry.pack(side="left", padx=2)
+            var = tk.DoubleVar(value=10)
+            ttk.Entry(
+                margins_frame, textvariable=var, width=5,
+                validate="key", validatecommand=validate_margin
+            ).pack(side="left", padx=2)
             ttk.Label(margins_frame, text=label).pack(side="left")
-            self.margins[attr] = entry
+            self.margins[attr] = var
 
         # Convert Button
         ttk.Button(main_frame, text="Convert to PDF", command=self.convert_images_to_pdf).pack(pady=10)
 
+    @staticmethod
+    def _is_margin_text(text: str) -> bool:
+        """Entry validator: accept only text that is, or is on its way to, a non-negative number."""
+        return text == "" or text.replace(".", "", 1).isdigit()
+
     def _create_listbox(self, parent):
-        """Create a scrollable listbox with a scrollbar."""
+        """Create a scrollable file list with a scrollbar.
+
+        The list is a single-column Treeview that only lays out its visible rows.
+        Each row's item id is the file path itself, so the ids are the file list.
+        """
         list_frame = ttk.Frame(parent)
         list_frame.pack(fill="both", expand=True, pady=5)
-        listbox = tk.Listbox(list_frame, selectmode=tk.EXTENDED, height=6)
+        listbox = ttk.Treeview(list_frame, show="tree", selectmode="extended", height=6)
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=listbox.yview)
         listbox.configure(yscrollcommand=scrollbar.set)
         listbox.pack(side="left", fill="both", expand=True)
@@ -296,7 +317,7 @@ class PDFToolkitApp(TkinterDnD.Tk):
             ("Remove Selected", lambda: self.remove_selected(listbox)),
             ("Move Up", lambda: self.move_list_item(listbox, -1)),
             ("Move Down", lambda: self.move_list_item(listbox, 1)),
-            ("Clear All", lambda: listbox.delete(0, tk.END)),
+            ("Clear All", lambda: listbox.delete(*listbox.get_children())),
         ]
         for text, cmd in buttons:
             ttk.Button(parent, text=text, command=cmd).pack(side="left", padx=2, fill="x", expand=True)
@@ -307,10 +328,19 @@ class PDFToolkitApp(TkinterDnD.Tk):
         self.dnd_bind("<<Drop>>", self.handle_drop)
 
     def handle_drop(self, event):
-        """Handle dropped files for the main window."""
-        file_path = Path(self.clean_dropped_path(event.data))
+        """Handle dropped files for the main window, honouring only the latest of a quick burst."""
+        if self._drop_after_id:
+            self.after_cancel(self._drop_after_id)
+        self._drop_after_id = self.after(DROP_DEBOUNCE_MS, self._load_dropped_pdf, event.data)
+
+    def _load_dropped_pdf(self, data: str):
+        """Validate and load a PDF dropped on the main window."""
+        self._drop_after_id = None
+        if self._is_busy():
+            # Leave the path and fields alone so they keep describing the same document
+            return
+        file_path = Path(self.clean_dropped_path(data))
         if self.pdf_tools.is_valid_pdf(file_path):
-            self.pdf_file_path.set(str(file_path))
             self.load_pdf(file_path)
         else:
             self.clear_fields()
@@ -318,89 +348,118 @@ class PDFToolkitApp(TkinterDnD.Tk):
 
     def handle_pdf_drop(self, event):
         """Handle dropped PDF files for the merger listbox."""
-        file_path = Path(self.clean_dropped_path(event.data))
-        if self.pdf_tools.is_valid_pdf(file_path):
-            self._handle_file_drop(event, self.merger_listbox, [".pdf"])
+        if self.pdf_tools.is_valid_pdf(self.clean_dropped_path(event.data)):
+            self._handle_file_drop(event, self.merger_listbox, PDF_EXTENSIONS)
 
     def handle_image_drop(self, event):
         """Handle dropped image files for the image listbox."""
-        self._handle_file_drop(event, self.image_listbox, [".jpg", ".jpeg", ".png", ".bmp", ".gif"])
+        self._handle_file_drop(event, self.image_listbox, IMAGE_EXTENSIONS)
 
     def _handle_file_drop(self, event, listbox, extensions):
         """Generic handler for dropping files into a listbox."""
-        files = self.tk.splitlist(event.data)
-        for file in files:
-            if Path(file).suffix.lower() in extensions:
-                listbox.insert(tk.END, file)
+        data = event.data
+        # A single path without list syntax (spaces, braces, quotes, escapes) needs no Tcl parse
+        files = self.tk.splitlist(data) if TCL_LIST_CHARS.intersection(data) else (data,)
+        files = [file for file in files if file.rpartition(".")[2].lower() in extensions]
+        self._append_unique(listbox, files)
 
     @staticmethod
     def clean_dropped_path(raw_path: str) -> str:
         """Clean and normalize a dropped file path."""
         path = raw_path.strip()
-        return path[1:-1] if path.startswith("{") and path.endswith("}") else path
+        return path[1:-1] if path[:1] == "{" and path[-1:] == "}" else path
 
     def load_pdf(self, file_path=None):
         """Load a PDF file and populate metadata fields."""
+        if self._is_busy():
+            return
         if not file_path:
-            file_path = filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
+            file_path = self._ask(
+                "pdf_open", filedialog.askopenfilename, filetypes=[("PDF files", "*.pdf")]
+            )
             if not file_path:
                 return
             file_path = Path(file_path)
-            self.pdf_file_path.set(str(file_path))
+        self.pdf_file_path.set(str(file_path))
 
         try:
+            self.pdf_tools.clear_cache()  # Drop the previously loaded document
             file_name, metadata = self.pdf_tools.read_pdf(file_path)
             if metadata is None:
                 self.update_status(f"No metadata found in {file_name}", "purple")
                 return
-            for key, var in self.metadata_fields.items():
-                var.set(metadata.get(key, ""))
+            self._fill_metadata_fields(metadata)
             self.update_status(f"Loaded: {file_name}", "green")
         except Exception as e:
             self.update_status(f"Error: {str(e)}", "red")
             self.pdf_file_path.set("")
+            self.pdf_tools.clear_cache()
+
+    def _fill_metadata_fields(self, metadata: dict):
+        """Show metadata in the editor fields, leaving fields that already match untouched."""
+        for key, var in self.metadata_fields.items():
+            value = metadata.get(key, "")
+            if var.get() != value:  # Setting a variable redraws its entry even if unchanged
+                var.set(value)
 
     def update_status(self, message: str, color: str = "black"):
-        """Update the status bar with a message and color."""
+        """Update the status bar with a message and color.
+
+        The label is redrawn once Tk is idle, so only the last of several
+        updates made while handling one event reaches the screen.
+        """
+        self._pending_status = (message, color)
+        if not self._status_after_id:
+            self._status_after_id = self.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent status bar update."""
+        self._status_after_id = None
+        message, color = self._pending_status
         self.status_bar.config(text=message, foreground=color)
 
     def clear_fields(self):
         """Reset all input fields to empty and clear merger and image listboxes."""
+        if self._is_busy():
+            return
         self.pdf_file_path.set("")
         self.page_range_var.set("")
         self.image_dir_var.set("")
-        for var in self.metadata_fields.values():
-            var.set("")
-        self.merger_listbox.delete(0, tk.END)
-        self.image_listbox.delete(0, tk.END)
+        self._fill_metadata_fields({})
+        for listbox in (self.merger_listbox, self.image_listbox):
+            if listbox is not None:  # None until its tab has been opened
+                listbox.delete(*listbox.get_children())
+        self.pdf_tools.clear_cache()
         self.update_status("All fields cleared.", "blue")
 
     def browse_image_dir(self):
         """Select an output directory for image extraction."""
-        directory = filedialog.askdirectory()
+        directory = self._ask("image_dir", filedialog.askdirectory)
         if directory:
             self.image_dir_var.set(directory)
 
     def load_metadata_from_json(self):
         """Load metadata from a JSON file into fields."""
-        json_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+        json_path = self._ask(
+            "json_open", filedialog.askopenfilename, filetypes=[("JSON files", "*.json")]
+        )
         if not json_path:
             return
         try:
-            metadata = self.pdf_tools.get_metadata_from_json(Path(json_path))
+            json_path = Path(json_path)
+            metadata = self.pdf_tools.get_metadata_from_json(json_path)
             if metadata:
-                for key, var in self.metadata_fields.items():
-                    var.set(metadata.get(key, ""))
-                self.update_status(f"Loaded metadata from {Path(json_path).name}", "green")
+                self._fill_metadata_fields(metadata)
+                self.update_status(f"Loaded metadata from {json_path.name}", "green")
             else:
-                self.update_status(f"No metadata in {Path(json_path).name}", "purple")
+                self.update_status(f"No metadata in {json_path.name}", "purple")
         except Exception as e:
             self._show_error(f"An error occurred: {e}", "red")
 
     def dump_metadata(self):
         """Save current metadata to a JSON file."""
-        metadata = {key: var.get() for key, var in self.metadata_fields.items()}
-        if not any(metadata.values()):
+        metadata = self._collect_metadata()
+        if not metadata:
             self.update_status("No metadata to save!", "purple")
             return
         output_path = self._save_file_dialog(".json", [("JSON files", "*.json")])
@@ -408,38 +467,63 @@ class PDFToolkitApp(TkinterDnD.Tk):
             return
         self._save_to_file(self.pdf_tools.save_metadata_to_json, metadata, output_path, "Metadata")
 
+    def _collect_metadata(self) -> dict:
+        """Return the non-empty metadata fields; empty ones would only be written as blank strings."""
+        metadata = {}
+        for key, var in self.metadata_fields.items():
+            value = var.get()
+            if value:
+                metadata[key] = value
+        return metadata
+
     def save_pdf_with_metadata(self):
         """Save the PDF with updated metadata."""
         input_file = self.pdf_file_path.get()
         if not input_file:
             self._show_error("Please load a PDF file first!", "purple")
             return
-        metadata = {key: var.get() for key, var in self.metadata_fields.items()}
-        if not any(metadata.values()):
+        metadata = self._collect_metadata()
+        if not metadata:
             self.update_status("No metadata to save!", "purple")
             return
         output_path = self._save_file_dialog(".pdf", [("PDF files", "*.pdf")])
         if not output_path:
             return
-        self._save_to_file(self.pdf_tools.save_pdf, metadata, output_path, "PDF")
+        self._save_to_file(
+            partial(self.pdf_tools.save_pdf, input_file), metadata, output_path, "PDF"
+        )
 
     def _save_file_dialog(self, extension: str, filetypes: list) -> Path:
         """Open a save file dialog and return the selected path."""
-        path = filedialog.asksaveasfilename(defaultextension=extension, filetypes=filetypes)
+        path = self._ask(
+            f"{extension[1:]}_save", filedialog.asksaveasfilename,
+            defaultextension=extension, filetypes=filetypes
+        )
         return Path(path) if path else None
 
+    def _ask(self, kind: str, dialog, **options):
+        """Show a file dialog that starts where the last dialog of the same kind left off."""
+        result = dialog(initialdir=self._last_dirs.get(kind), **options)
+        if result:
+            if dialog is filedialog.askdirectory:
+                self._last_dirs[kind] = result
+            else:  # askopenfilenames returns a tuple, the others a single path
+                self._last_dirs[kind] = os.path.dirname(
+                    result if isinstance(result, str) else result[0]
+                )
+        return result
+
     def _save_to_file(self, save_func, data, output_path: Path, item_type: str):
         """Generic method to save data to a file with error handling."""
-        try:
-            if item_type == "PDF":
-                input_file = self.pdf_file_path.get()
-                save_func(input_file, data, output_path)
-            else:
-                save_func(data, output_path)
+
+        def on_success(_):
             self.update_status(f"{item_type} saved to {output_path}", "green")
             messagebox.showinfo("Success", f"{item_type} saved to {output_path.name}")
-        except Exception as e:
-            self._show_error(f"An error occurred: {e}", "red")
+
+        self._run_in_background(
+            partial(save_func, data, output_path), on_success, f"Saving {item_type}...",
+            on_error=lambda e: self._show_error(f"An error occurred: {e}", "red")
+        )
 
     def extract_pages(self):
         """Extract specified pages from the loaded PDF."""
@@ -455,12 +539,15 @@ class PDFToolkitApp(TkinterDnD.Tk):
         if not output_path:
             self.update_status("No output path selected.", "purple")
             return
-        try:
-            self.pdf_tools.extract_pages(input_file, page_range, output_path)
+
+        def on_success(_):
             self.update_status("Pages extracted successfully!", "green")
             messagebox.showinfo("Success", "Pages extracted successfully!")
-        except Exception as e:
-            self._show_error(str(e), "red")
+
+        self._run_in_background(
+            partial(self.pdf_tools.extract_pages, input_file, page_range, output_path),
+            on_success, "Extracting pages..."
+        )
 
     def extract_all_images(self):
         """Extract all images from the loaded PDF."""
@@ -472,76 +559,142 @@ class PDFToolkitApp(TkinterDnD.Tk):
         if not output_dir:
             self._show_error("Please select an output directory!", "purple")
             return
-        output_dir = Path(output_dir)
-        try:
-            extracted = self.pdf_tools.extract_images_from_pdf(input_file, output_dir)
+
+        def on_success(extracted):
             self.update_status(f"{len(extracted)} images extracted to {output_dir}", "green")
             messagebox.showinfo("Success", f"{len(extracted)} images extracted successfully!")
-        except Exception as e:
-            self._show_error(str(e), "red")
+
+        self._run_in_background(
+            partial(self.pdf_tools.extract_images_from_pdf, input_file, output_dir),
+            on_success, "Extracting images..."
+        )
 
     def _show_error(self, message: str, color: str):
         """Display an error message in the status bar and a dialog."""
         self.update_status(message, color)
         messagebox.showerror("Error", message)
 
+    def _is_busy(self) -> bool:
+        """Report (in the status bar) whether a background task is still running."""
+        if self._worker is not None and self._worker.is_alive():
+            self.update_status("Please wait for the current operation to finish.", "purple")
+            return True
+        return False
+
+    def _run_in_background(self, task, on_success, busy_message: str, on_error=None):
+        """Run task on a worker thread and pass its result to on_success on the Tk thread.
+
+        Only one task runs at a time: PdfTools shares its document cache between
+        calls and PyMuPDF documents must not be used from two threads at once.
+        Widgets and dialogs are only touched from the Tk thread, via _poll_worker.
+        """
+        if self._is_busy():
+            return
+        results = queue.Queue(maxsize=1)
+
+        def worker():
+            try:
+                results.put((True, task()))
+            except Exception as e:
+                results.put((False, e))
+
+        self.update_status(busy_message, "blue")
+        self.progress_bar.pack(fill="x", pady=(5, 0))
+        self.progress_bar.start()
+        self._worker = threading.Thread(target=worker, daemon=True)
+        self._worker.start()
+        self.after(
+            WORKER_POLL_MS, self._poll_worker, results, on_success,
+            on_error or (lambda e: self._show_error(str(e), "red"))
+        )
+
+    def _poll_worker(self, results, on_success, on_error):
+        """Dispatch the result of a background task once it is available."""
+        try:
+            succeeded, value = results.get_nowait()
+        except queue.Empty:
+            self.after(WORKER_POLL_MS, self._poll_worker, results, on_success, on_error)
+            return
+        self.progress_bar.stop()
+        self.progress_bar.pack_forget()
+        if succeeded:
+            on_success(value)
+        else:
+            on_error(value)
+
     def add_pdfs_to_merge(self):
         """Add PDF files to the merger listbox."""
-        self._add_files_to_listbox(self.merger_listbox, [("PDF files", "*.pdf")])
+        self._add_files_to_listbox(self.merger_listbox, "pdf_open", [("PDF files", "*.pdf")])
 
     def add_images_to_convert(self):
         """Add image files to the image listbox."""
         self._add_files_to_listbox(
-            self.image_listbox, [("Image files", "*.jpg *.jpeg *.png *.bmp *.gif")]
+            self.image_listbox, "image_open", [("Image files", "*.jpg *.jpeg *.png *.bmp *.gif")]
         )
 
-    def _add_files_to_listbox(self, listbox, filetypes):
+    def _add_files_to_listbox(self, listbox, kind: str, filetypes):
         """Generic method to add files to a listbox."""
-        files = filedialog.askopenfilenames(filetypes=filetypes)
-        for file in files:
-            listbox.insert(tk.END, file)
+        self._append_unique(
+            listbox, self._ask(kind, filedialog.askopenfilenames, filetypes=filetypes)
+        )
+
+    @staticmethod
+    def _append_unique(listbox, files):
+        """Append the files that are not listed yet, keeping their order.
+
+        Paths are stored in absolute, normalized form, so different spellings of
+        one file count as duplicates and the PDF tools get ready-to-use paths.
+        """
+        listed = set(listbox.get_children())
+        for file in dict.fromkeys(map(os.path.abspath, files)):
+            if file not in listed:
+                listbox.insert("", "end", iid=file, text=file)
 
     def remove_selected(self, listbox):
         """Remove selected items from a listbox."""
-        for index in reversed(listbox.curselection()):
-            listbox.delete(index)
+        selected = listbox.selection()
+        if selected:
+            listbox.delete(*selected)
 
     def move_list_item(self, listbox, direction):
         """Move selected items up or down in a listbox."""
-        selected = listbox.curselection()
+        selected = sorted(listbox.selection(), key=listbox.index)
         if not selected:
             return
-        for index in selected:
-            if direction == -1 and index > 0:  # Move up
-                item = listbox.get(index)
-                listbox.delete(index)
-                listbox.insert(index - 1, item)
-                listbox.select_set(index - 1)
-            elif direction == 1 and index < listbox.size() - 1:  # Move down
-                item = listbox.get(index)
-                listbox.delete(index)
-                listbox.insert(index + 1, item)
-                listbox.select_set(index + 1)
+        count = len(listbox.get_children())
+        # Items nearest the edge move first so a selected block shifts as one; an
+        # item blocked by the edge or by a blocked neighbour stays where it is.
+        occupied = set()
+        for item in (selected if direction == -1 else reversed(selected)):
+            index = listbox.index(item)
+            target = index + direction
+            if 0 <= target < count and target not in occupied:
+                listbox.move(item, "", target)  # Swaps with the neighbour; stays selected
+                index = target
+            occupied.add(index)
 
     def merge_pdfs(self):
         """Merge PDFs from the listbox (placeholder)."""
-        files = list(self.merger_listbox.get(0, tk.END))
+        files = list(self.merger_listbox.get_children())
         if not files:
             self._show_error("No PDFs selected to merge!", "purple")
             return
         output_path = self._save_file_dialog(".pdf", [("PDF files", "*.pdf")])
         if not output_path:
             return
-        try:
-            self.pdf_tools.concatenate_pdfs(files, output_path)
+
+        def on_success(_):
             self.update_status(f"PDFs merged successfully to {output_path}", "green")
             messagebox.showinfo("Success", "PDFs merged successfully!")
-        except Exception as e:
-            self._show_error(str(e), "red")
+
+        self._run_in_background(
+            partial(self.pdf_tools.concatenate_pdfs, files, output_path),
+            on_success, "Merging PDFs..."
+        )
 
     def convert_images_to_pdf(self):
         """Convert images to PDF (placeholder)."""
-        images = list(self.image_listbox.get(0, tk.END))
+        images = list(self.image_listbox.get_children())
         if not images:
             self._show_error("No images selected to convert!", "purple")
             return
@@ -549,21 +702,31 @@ class PDFToolkitApp(TkinterDnD.Tk):
         if not output_path:
             return
         try:
-            self.pdf_tools.create_pdf_from_images(
+            # Tk variables are read here, on the Tk thread, before handing off the work
+            task = partial(
+                self.pdf_tools.create_pdf_from_images,
                 images,
-                float(self.margins["left"].get()),
-                float(self.margins["right"].get()),
-                float(self.margins["top"].get()),
-                float(self.margins["bottom"].get()),
+                self.margins["left"].get(),
+                self.margins["right"].get(),
+                self.margins["top"].get(),
+                self.margins["bottom"].get(),
                 self.page_size_var.get(),
                 self.orientation_var.get(),
                 self.scaling_var.get(),
                 output_path
             )
-            self.update_status(f"Images converted to PDF: {output_path}", "green")
-            messagebox.showinfo("Success", "Images converted to PDF successfully!")
+        except tk.TclError:  # An emptied margin entry cannot be read as a number
+            self._show_error("Please enter all four margins!", "purple")
+            return
         except Exception as e:
             self._show_error(str(e), "red")
+            return
+
+        def on_success(_):
+            self.update_status(f"Images converted to PDF: {output_path}", "green")
+            messagebox.showinfo("Success", "Images converted to PDF successfully!")
+
+        self._run_in_background(task, on_success, "Converting images to PDF...")
 
     def exit_application(self):
         """Close the application."""
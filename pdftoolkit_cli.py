@@ -1,176 +1,248 @@
 import sys
 import argparse
-from pathlib import Path
-from typing import Union
-from pdf_ops import PdfTools
+from typing import Optional, Union
+
+
+# Named scaling options; integers 1-4 select them by position.
+SCALING_OPTIONS = ("scale to fit", "stretch to fit", "actual size", "stretch to fill")
+_VALID_SCALING = frozenset(SCALING_OPTIONS)
 
 
 def scaling_value(value: Union[str, int]) -> Union[str, int]:
-    valid_scaling = {"scale to fit", "stretch to fit", "actual size", "stretch to fill"}
-    try:
-        ivalue = int(value)
+    text = str(value).strip()
+    if (text[1:] if text[:1] in ("+", "-") else text).isdecimal():  # At most one sign
+        ivalue = int(text)
         if not 1 <= ivalue <= 4:
             raise argparse.ArgumentTypeError("Scaling integer must be between 1 and 4")
         return ivalue
-    except ValueError:
-        lower_value = value.lower()
-        if lower_value not in valid_scaling:
-            raise argparse.ArgumentTypeError(
-                f"Invalid scaling option. Choose from {valid_scaling} or 1-4."
-            )
-        return lower_value
+    lower_value = value.lower()
+    if lower_value not in _VALID_SCALING:
+        raise argparse.ArgumentTypeError(
+            f"Invalid scaling option. Choose from {', '.join(SCALING_OPTIONS)} or 1-4."
+        )
+    return lower_value
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="PDF Toolkit CLI - perform various PDF operations."
+def positive_int(value: str) -> int:
+    ivalue = int(value)
+    if ivalue < 1:
+        raise argparse.ArgumentTypeError("Value must be at least 1")
+    return ivalue
+
+
+def _add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs", "-j", type=positive_int, default=None,
+        help="Maximum number of parallel workers (default: number of CPUs)"
     )
-    subparsers = parser.add_subparsers(dest="command", help="Sub-command help")
 
-    # Subparser for reading PDF metadata
-    parser_read = subparsers.add_parser("read", help="Read PDF metadata")
-    parser_read.add_argument("pdf_file", type=Path, help="Path to the PDF file")
 
-    # Subparser for validating a PDF file
-    parser_validate = subparsers.add_parser("validate", help="Validate a PDF file")
-    parser_validate.add_argument("pdf_file", type=Path, help="Path to the PDF file")
+def _add_read_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("pdf_file", type=str, help="Path to the PDF file")
+
 
-    # Subparser for extracting pages
-    parser_extract = subparsers.add_parser(
-        "extract-pages", help="Extract specific pages from a PDF"
+def _add_validate_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("pdf_file", type=str, help="Path to the PDF file")
+    parser.add_argument(
+        "--check-trailer", action="store_true",
+        help="Also check the end of the file for the PDF trailer (catches truncated files)"
     )
-    parser_extract.add_argument("pdf_file", type=Path, help="Path to the PDF file")
-    parser_extract.add_argument(
+
+
+def _add_extract_pages_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("pdf_file", type=str, help="Path to the PDF file")
+    parser.add_argument(
         "page_range", type=str, help="Page range (e.g., '1-3,5')"
     )
-    parser_extract.add_argument(
-        "output_pdf", type=Path, help="Path to the output PDF file"
+    parser.add_argument(
+        "output_pdf", type=str, help="Path to the output PDF file"
     )
 
-    # Subparser for extracting images
-    parser_extract_images = subparsers.add_parser(
-        "extract-images", help="Extract images from a PDF"
-    )
-    parser_extract_images.add_argument("pdf_file", type=Path, help="Path to the PDF file")
-    parser_extract_images.add_argument(
-        "output_dir", type=Path, help="Directory to save the extracted images"
+
+def _add_extract_images_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("pdf_file", type=str, help="Path to the PDF file")
+    parser.add_argument(
+        "output_dir", type=str, help="Directory to save the extracted images"
     )
+    _add_jobs_argument(parser)
+
 
-    # Subparser for merging PDFs
-    parser_merge = subparsers.add_parser("merge", help="Merge multiple PDFs")
-    parser_merge.add_argument(
-        "pdf_files", type=Path, nargs="+", help="List of PDF files to merge"
+def _add_merge_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "pdf_files", type=str, nargs="+", help="List of PDF files to merge"
     )
-    parser_merge.add_argument(
-        "output_pdf", type=Path, help="Path to the merged output PDF file"
+    parser.add_argument(
+        "output_pdf", type=str, help="Path to the merged output PDF file"
     )
+    _add_jobs_argument(parser)
 
-    # Subparser for creating a PDF from images
-    parser_create = subparsers.add_parser(
-        "create-from-images", help="Create a PDF from images"
-    )
-    parser_create.add_argument(
-        "image_files", type=Path, nargs="+", help="List of image files"
+
+def _add_create_from_images_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "image_files", type=str, nargs="+", help="List of image files"
     )
-    parser_create.add_argument(
-        "output_pdf", type=Path, help="Path to the output PDF file"
+    parser.add_argument(
+        "output_pdf", type=str, help="Path to the output PDF file"
     )
-    parser_create.add_argument(
+    parser.add_argument(
     "--margins",
     type=float,
     nargs=4,
     metavar=("LEFT", "RIGHT", "TOP", "BOTTOM"),
     help="Margin values in mm for left, right, top, and bottom (overrides individual margins if provided)."
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--margin-left", type=float, default=10, help="Left margin in mm (default: 10)"
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--margin-right", type=float, default=10, help="Right margin in mm (default: 10)"
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--margin-top", type=float, default=10, help="Top margin in mm (default: 10)"
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--margin-bottom", type=float, default=10, help="Bottom margin in mm (default: 10)"
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--page-size", type=str, default="A4", help="Page size (e.g., A4, Letter)"
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--orientation",
         type=str,
         default="portrait",
         help="Page orientation ('portrait' or 'landscape')",
     )
-    parser_create.add_argument(
+    parser.add_argument(
         "--scaling",
         type=scaling_value,
         default="scale to fit",
         help=("Scaling option: accepts 'scale to fit', 'stretch to fit', "
               "'actual size', 'stretch to fill' or an integer (1-4) mapping to these options."),
     )
+    _add_jobs_argument(parser)
+
+
+def _run_read(tools, args) -> None:
+    name, metadata = tools.read_pdf(args.pdf_file)
+    lines = [f"File: {name}", "Metadata:"]
+    lines.extend(f"  {key}: {value}" for key, value in metadata.items())
+    sys.stdout.write("\n".join(lines) + "\n")  # One write instead of one per line
+
+
+def _run_validate(tools, args) -> None:
+    valid = tools.is_valid_pdf(args.pdf_file, check_trailer=args.check_trailer)
+    status = "valid" if valid else "invalid"
+    print(f"{args.pdf_file} is {status}.")
+
+
+def _run_extract_pages(tools, args) -> None:
+    tools.extract_pages(args.pdf_file, args.page_range, args.output_pdf)
+    print(f"Extracted pages saved to {args.output_pdf}")
 
+
+def _run_extract_images(tools, args) -> None:
+    images = tools.extract_images_from_pdf(args.pdf_file, args.output_dir)
+    lines = [f"Extracted {len(images)} image(s):"]
+    lines.extend(f"  {image}" for image in images)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _run_merge(tools, args) -> None:
+    tools.concatenate_pdfs(args.pdf_files, args.output_pdf)
+    print(f"Merged PDF saved to {args.output_pdf}")
+
+
+def _run_create_from_images(tools, args) -> None:
+    if args.margins is not None:
+        margin_left, margin_right, margin_top, margin_bottom = args.margins
+    else:
+        margin_left = args.margin_left
+        margin_right = args.margin_right
+        margin_top = args.margin_top
+        margin_bottom = args.margin_bottom
+
+    tools.create_pdf_from_images(
+        args.image_files,
+        margin_left,
+        margin_right,
+        margin_top,
+        margin_bottom,
+        args.page_size,
+        args.orientation,
+        args.scaling,
+        args.output_pdf,
+    )
+    print(f"PDF created from images saved to {args.output_pdf}")
+
+
+# Sub-command name -> (help text, function adding its arguments, function running it)
+COMMANDS = {
+    "read": ("Read PDF metadata", _add_read_arguments, _run_read),
+    "validate": ("Validate a PDF file", _add_validate_arguments, _run_validate),
+    "extract-pages": (
+        "Extract specific pages from a PDF", _add_extract_pages_arguments, _run_extract_pages
+    ),
+    "extract-images": (
+        "Extract images from a PDF", _add_extract_images_arguments, _run_extract_images
+    ),
+    "merge": ("Merge multiple PDFs", _add_merge_arguments, _run_merge),
+    "create-from-images": (
+        "Create a PDF from images", _add_create_from_images_arguments, _run_create_from_images
+    ),
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    Args:
+        command: If this names a sub-command, only that sub-command's parser is
+            built. Otherwise (help, typos, no command) all of them are, so usage
+            and error messages list every choice.
+
+    Returns:
+        The top-level argument parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="PDF Toolkit CLI - perform various PDF operations."
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Sub-command help")
+    names = [command] if command in COMMANDS else COMMANDS
+    for name in names:
+        help_text, add_arguments, _ = COMMANDS[name]
+        add_arguments(subparsers.add_parser(name, help=help_text))
+    return parser
+
+
+def main() -> int:
+    """
+    Run the CLI.
+
+    Returns:
+        The process exit status: 0 on success, 1 on failure.
+    """
+    parser = build_parser(sys.argv[1] if len(sys.argv) > 1 else None)
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
-        sys.exit(1)
+        return 1
+
+    # Imported only once there is work to do, so --help and usage errors stay fast
+    from pdf_ops import PdfTools
 
-    tools = PdfTools()
+    tools = PdfTools(max_workers=getattr(args, "jobs", None))
 
+    _, _, run_command = COMMANDS[args.command]  # argparse has already rejected unknown names
     try:
-        if args.command == "read":
-            name, metadata = tools.read_pdf(args.pdf_file)
-            print(f"File: {name}")
-            print("Metadata:")
-            for key, value in metadata.items():
-                print(f"  {key}: {value}")
-        elif args.command == "validate":
-            valid = tools.is_valid_pdf(args.pdf_file)
-            status = "valid" if valid else "invalid"
-            print(f"{args.pdf_file} is {status}.")
-        elif args.command == "extract-pages":
-            tools.extract_pages(args.pdf_file, args.page_range, args.output_pdf)
-            print(f"Extracted pages saved to {args.output_pdf}")
-        elif args.command == "extract-images":
-            images = tools.extract_images_from_pdf(args.pdf_file, args.output_dir)
-            print(f"Extracted {len(images)} image(s):")
-            for image in images:
-                print(f"  {image}")
-        elif args.command == "merge":
-            tools.concatenate_pdfs(args.pdf_files, args.output_pdf)
-            print(f"Merged PDF saved to {args.output_pdf}")
-        elif args.command == "create-from-images":
-            if args.margins is not None:
-                margin_left, margin_right, margin_top, margin_bottom = args.margins
-            else:
-                margin_left = args.margin_left
-                margin_right = args.margin_right
-                margin_top = args.margin_top
-                margin_bottom = args.margin_bottom
-
-            tools.create_pdf_from_images(
-                args.image_files,
-                margin_left,
-                margin_right,
-                margin_top,
-                margin_bottom,
-                args.page_size,
-                args.orientation,
-                args.scaling,
-                args.output_pdf,
-            )
-            print(f"PDF created from images saved to {args.output_pdf}")
-        else:
-            parser.print_help()
-            sys.exit(1)
+        run_command(tools, args)
     except Exception as err:
         print(f"Error: {err}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
-    sys.exit(0)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,26 @@
+import argparse
+import unittest
+
+from pdftoolkit_cli import scaling_value
+
+
+class ScalingValueTest(unittest.TestCase):
+    def test_integers_and_names(self):
+        self.assertEqual(scaling_value("2"), 2)
+        self.assertEqual(scaling_value(" +3 "), 3)
+        self.assertEqual(scaling_value(4), 4)
+        self.assertEqual(scaling_value("Actual Size"), "actual size")
+
+    def test_out_of_range_integer(self):
+        for value in ("0", "-1", "5"):
+            with self.assertRaisesRegex(argparse.ArgumentTypeError, "between 1 and 4"):
+                scaling_value(value)
+
+    def test_repeated_signs_are_rejected(self):
+        for value in ("+-1", "--1"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                scaling_value(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
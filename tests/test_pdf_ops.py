@@ -0,0 +1,96 @@
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import pdf_ops
+from pdf_ops import PdfTools
+
+try:
+    from PyPDF2 import PdfReader as PyPDF2Reader
+except ImportError:
+    PyPDF2Reader = None
+
+
+def build_pdf(objects: list, info: int = 0) -> bytes:
+    """
+    Serialize object bodies (numbered from 1; object 1 is the catalog) into a PDF.
+
+    info, if given, is the number of the object to use as the Info dictionary.
+    """
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R%s >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, b" /Info %d 0 R" % info if info else b"", xref)
+    return bytes(out)
+
+
+# Page 1 has no /Resources at all; page 2 draws a 1x1 RGB image.
+NO_RESOURCES_PDF = build_pdf([
+    b"<< /Type /Catalog /Pages 2 0 R >>",
+    b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>",
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 100 100] >>",
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 100 100]"
+    b" /Resources << /XObject << /Im0 5 0 R >> >> >>",
+    b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceRGB"
+    b" /BitsPerComponent 8 /Length 3 >>\nstream\n\xff\x00\x00\nendstream",
+])
+
+# One blank page and an Info dictionary with a custom entry.
+CUSTOM_INFO_PDF = build_pdf([
+    b"<< /Type /Catalog /Pages 2 0 R >>",
+    b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 100 100] >>",
+    b"<< /Title (Report) /Company (Example Ltd) >>",
+], info=4)
+
+
+class ReadPdfTest(unittest.TestCase):
+    def test_custom_info_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "custom.pdf"
+            pdf_path.write_bytes(CUSTOM_INFO_PDF)
+            tools = PdfTools()
+            _, metadata = tools.read_pdf(pdf_path)
+            tools.clear_cache()
+        self.assertEqual(metadata.get("/Title"), "Report")
+        self.assertEqual(metadata.get("/Company"), "Example Ltd")
+
+
+class MetadataJsonTest(unittest.TestCase):
+    def test_stdlib_fallback_format(self):
+        metadata = {"/Title": "Ünïcode", "/Pages": 3, "/Day": date(2024, 1, 2)}
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / "metadata.json"
+            with mock.patch.object(pdf_ops, "orjson", None):
+                PdfTools().save_metadata_to_json(metadata, json_path)
+            content = json_path.read_text(encoding="utf-8")
+        self.assertEqual(
+            content, '{\n    "/Title": "Ünïcode",\n    "/Pages": 3,\n    "/Day": "2024-01-02"\n}')
+
+
+class ExtractImagesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    @unittest.skipIf(PyPDF2Reader is None, "PyPDF2 is not installed")
+    def test_pypdf2_page_without_resources(self):
+        pdf_path = self.tmp / "nores.pdf"
+        pdf_path.write_bytes(NO_RESOURCES_PDF)
+        with mock.patch.multiple(pdf_ops, pymupdf=None, PdfReader=PyPDF2Reader,
+                                 PRODUCER="PDF Toolkit with PyPDF2", _BACKEND="pypdf2"):
+            images = PdfTools().extract_images_from_pdf(pdf_path, self.tmp / "out")
+        self.assertEqual([image.name for image in images], ["page2_img1.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()